@@ -1,13 +1,16 @@
 """Core coherence measurement primitives."""
 
-from .coherence_metric import CoherenceMetric, SystemState, PHI
-from .golden_ratio_trust import GoldenRatioTrust, TrustChamber, TrustState
+from .coherence_metric import CoherenceMetric, SystemBatch, SystemState, PHI, INV_PHI
+from .golden_ratio_trust import ChamberStore, GoldenRatioTrust, TrustChamber, TrustState
 
 __all__ = [
     "CoherenceMetric",
     "SystemState",
+    "SystemBatch",
     "PHI",
+    "INV_PHI",
     "GoldenRatioTrust",
     "TrustChamber",
+    "ChamberStore",
     "TrustState",
 ]
@@ -4,14 +4,22 @@ MCPM Core: Systemic Coherence Measurement
 This module MEASURES systemic health. It does NOT control or optimize systems.
 """
 
+import math
+import sys
+
 import numpy as np
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Sequence
 from dataclasses import dataclass
 
 PHI = 1.618033988749895  # Golden ratio
+INV_PHI = 0.6180339887498948  # 1 / PHI, as a literal
 
+# __slots__ dataclasses (no per-instance __dict__) where supported (3.10+);
+# shared by the dataclasses of every module in this package
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SystemState:
     """State of a system being measured"""
     resonance_energy: float  # R_e: Constructive interaction flow
@@ -24,6 +32,73 @@ class SystemState:
     energy_cost: Optional[float] = None  # kWh/day
     population: Optional[int] = None
     description: Optional[str] = None
+    
+    def __post_init__(self):
+        # One layout for every coupling matrix: C-contiguous float64.
+        # No copy when it already is one (e.g. shared read-only constants).
+        self.coupling_matrix = np.ascontiguousarray(self.coupling_matrix, dtype=np.float64)
+
+
+@dataclass
+class SystemBatch:
+    """
+    Many systems stored field-by-field (one array per parameter).
+    
+    Lets M(S) be measured for N systems in a handful of NumPy
+    operations instead of N separate calls.
+    """
+    resonance_energy: np.ndarray   # (N,)
+    adaptability: np.ndarray       # (N,)
+    diversity: np.ndarray          # (N,)
+    coupling_matrices: np.ndarray  # (N, n, n)
+    loss_rate: np.ndarray          # (N,)
+    energy_cost: np.ndarray        # (N,) kWh/day, NaN where unknown
+    
+    @classmethod
+    def from_states(cls, states: Sequence[SystemState]) -> "SystemBatch":
+        """Pack SystemState objects of equal coupling size into a batch"""
+        return cls(
+            resonance_energy=np.array([s.resonance_energy for s in states], dtype=float),
+            adaptability=np.array([s.adaptability for s in states], dtype=float),
+            diversity=np.array([s.diversity for s in states], dtype=float),
+            coupling_matrices=np.array([s.coupling_matrix for s in states], dtype=float),
+            loss_rate=np.array([s.loss_rate for s in states], dtype=float),
+            energy_cost=np.array(
+                [np.nan if s.energy_cost is None else s.energy_cost for s in states],
+                dtype=float
+            ),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.resonance_energy)
+
+
+def _deviation_sq_2x2(c00: float, c01: float, c10: float, c11: float,
+                      s00: float, s01: float, s10: float, s11: float) -> float:
+    """||C - C*||² for 2x2 matrices given entry by entry (row-major)"""
+    return (c00 - s00)**2 + (c01 - s01)**2 + (c10 - s10)**2 + (c11 - s11)**2
+
+
+def _coherence_kernel(resonance_energy: float,
+                      adaptability: float,
+                      diversity: float,
+                      deviation_sq: float,
+                      alpha: float,
+                      loss_rate: float) -> float:
+    """
+    M(S) from plain floats, with f(C) = exp(-alpha * ||C - C*||²).
+    
+    Kept free of NumPy and object access so it stays a single cheap
+    call on the hot path.
+    """
+    # Coupling function
+    f_C = math.exp(-alpha * deviation_sq)
+    
+    # Coherent gain
+    gain = resonance_energy * adaptability * diversity * f_C
+    
+    # Total coherence
+    return gain - loss_rate
 
 
 class CoherenceMetric:
@@ -39,6 +114,9 @@ class CoherenceMetric:
     Use this to reveal truth about system health, not to control systems.
     """
     
+    # Distinct coupling matrices remembered by _deviation_sq()
+    _DEVIATION_SQ_CACHE_SIZE = 128
+    
     def __init__(self, 
                  alpha: float = 1.0,
                  coupling_optimum: Optional[np.ndarray] = None):
@@ -51,8 +129,46 @@ class CoherenceMetric:
                             If None, uses identity scaled by phi
         """
         self.alpha = alpha
+        
+        # C* per system size, built once instead of on every call
+        self._C_star_cache: Dict[int, np.ndarray] = {}
+        # 2x2 C* as plain floats for the scalar fast path
+        self._C_star_2x2: Optional[Tuple[float, float, float, float]] = None
+        # ||C - C*||² per distinct coupling matrix, keyed by (bytes, shape);
+        # fixed patterns and replacement sweeps reuse the same few matrices
+        self._deviation_sq_cache: Dict[Tuple[bytes, Tuple[int, ...]], float] = {}
         self.coupling_optimum = coupling_optimum
         
+    @property
+    def coupling_optimum(self) -> Optional[np.ndarray]:
+        """C* matrix, or None for identity scaled by phi"""
+        return self._coupling_optimum
+    
+    @coupling_optimum.setter
+    def coupling_optimum(self, value: Optional[np.ndarray]) -> None:
+        self._coupling_optimum = value
+        # Cached C* and deviations belong to the old optimum
+        self._C_star_cache.clear()
+        self._C_star_2x2 = None
+        self._deviation_sq_cache.clear()
+        if value is not None:
+            # A supplied C* is converted once, up front
+            self._optimum(len(value))
+        
+    def _optimum(self, n: int) -> np.ndarray:
+        """C* for an n-subsystem coupling matrix"""
+        C_star = self._C_star_cache.get(n)
+        if C_star is None:
+            if self.coupling_optimum is None:
+                # Default: identity scaled by phi
+                C_star = np.eye(n) / PHI
+            else:
+                C_star = np.asarray(self.coupling_optimum, dtype=np.float64)
+            self._C_star_cache[n] = C_star
+            if C_star.shape == (2, 2):
+                self._C_star_2x2 = tuple(C_star.ravel().tolist())
+        return C_star
+    
     def coupling_function(self, C: np.ndarray) -> float:
         """
         Non-monotonic coupling function f(C).
@@ -60,24 +176,42 @@ class CoherenceMetric:
         Peaked at optimal intermediate coupling (too weak = fragmented,
         too strong = rigid, optimal = flexible coherence).
         
+        Evaluated exactly with scalar math.exp (no ufunc dispatch, no
+        table approximation) so every reading can be reproduced from
+        the published formula.
+        
         Args:
             C: Coupling matrix
             
         Returns:
             f(C) value in [0, 1]
         """
-        if self.coupling_optimum is None:
-            # Default: identity scaled by phi
-            n = C.shape[0]
-            C_star = np.eye(n) / PHI
-        else:
-            C_star = self.coupling_optimum
-        
         # Inverse-U function: exp(-alpha * ||C - C*||^2)
-        deviation = np.linalg.norm(C - C_star, 'fro')
-        f_C = np.exp(-self.alpha * deviation**2)
+        return math.exp(-self.alpha * self._deviation_sq(C))
+    
+    def _deviation_sq(self, C: np.ndarray) -> float:
+        """||C - C*||² (squared Frobenius norm, summed directly - no sqrt)"""
+        C = np.ascontiguousarray(C, dtype=np.float64)
+        key = (C.tobytes(), C.shape)
+        cache = self._deviation_sq_cache
+        deviation_sq = cache.get(key)
+        if deviation_sq is None:
+            if len(cache) >= self._DEVIATION_SQ_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+            deviation_sq = cache[key] = self._deviation_sq_uncached(C)
+        return deviation_sq
+    
+    def _deviation_sq_uncached(self, C: np.ndarray) -> float:
+        """_deviation_sq() without the cache"""
+        C_star = self._optimum(C.shape[0])
+        
+        if C.shape == (2, 2) and C_star.shape == (2, 2):
+            # 2x2 is the common case; plain floats beat NumPy dispatch here
+            return _deviation_sq_2x2(*C.ravel().tolist(), *self._C_star_2x2)
         
-        return float(f_C)
+        diff = C - C_star
+        return float(np.einsum('ij,ij->', diff, diff))
     
     def calculate(self, 
                   resonance_energy: float,
@@ -102,14 +236,40 @@ class CoherenceMetric:
                  Positive = coherent/healthy
                  Negative = incoherent/collapsing
         """
-        # Calculate coupling function
-        f_C = self.coupling_function(coupling_matrix)
+        # No resonance, adaptability or diversity means no gain at all -
+        # skip the coupling function
+        if resonance_energy == 0 or adaptability == 0 or diversity == 0:
+            return float(0.0 - loss_rate)
         
-        # Coherent gain
-        gain = resonance_energy * adaptability * diversity * f_C
+        M_S = _coherence_kernel(
+            resonance_energy, adaptability, diversity,
+            self._deviation_sq(coupling_matrix), self.alpha, loss_rate
+        )
         
-        # Total coherence
-        M_S = gain - loss_rate
+        return float(M_S)
+    
+    def calculate_2x2(self,
+                      resonance_energy: float,
+                      adaptability: float,
+                      diversity: float,
+                      coupling: Tuple[float, float, float, float],
+                      loss_rate: float) -> float:
+        """
+        calculate() for a 2x2 coupling given as its four entries
+        (row-major: c00, c01, c10, c11) - no array needed.
+        """
+        if resonance_energy == 0 or adaptability == 0 or diversity == 0:
+            return float(0.0 - loss_rate)
+        
+        if self._C_star_2x2 is None:
+            self._optimum(2)
+            if self._C_star_2x2 is None:
+                raise ValueError("coupling_optimum is not a 2x2 matrix")
+        
+        M_S = _coherence_kernel(
+            resonance_energy, adaptability, diversity,
+            _deviation_sq_2x2(*coupling, *self._C_star_2x2), self.alpha, loss_rate
+        )
         
         return float(M_S)
     
@@ -123,6 +283,39 @@ class CoherenceMetric:
             state.loss_rate
         )
     
+    def calculate_many(self, batch: SystemBatch) -> np.ndarray:
+        """
+        Calculate M(S) for every system in a batch at once.
+        
+        Same formula as calculate(), evaluated across the batch:
+        M(S) = (R_e × A × D × f(C)) - L
+        
+        Returns:
+            (N,) array of M(S) values, in batch order
+        """
+        if len(batch) == 0:
+            return np.zeros(0)
+        
+        C = batch.coupling_matrices
+        C_star = self._optimum(C.shape[1])
+        product = batch.resonance_energy * batch.adaptability * batch.diversity
+        
+        # Systems with a zero factor have no gain; only the rest need f(C)
+        active = product != 0
+        if not active.all():
+            gain = np.zeros_like(product)
+            if active.any():
+                gain[active] = product[active] * self._coupling_many(C[active], C_star)
+            return gain - batch.loss_rate
+        
+        return product * self._coupling_many(C, C_star) - batch.loss_rate
+    
+    def _coupling_many(self, C: np.ndarray, C_star: np.ndarray) -> np.ndarray:
+        """f(C) for an (N, n, n) stack of coupling matrices"""
+        diff = C - C_star[None, :, :]
+        sq = np.einsum('bij,bij->b', diff, diff)
+        return np.exp(-self.alpha * sq)
+    
     def efficiency_ratio(self, state: SystemState) -> Optional[float]:
         """
         Calculate efficiency: M(S) / energy_cost
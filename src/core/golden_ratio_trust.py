@@ -9,9 +9,10 @@ This framework shows the geometric pattern when it does emerge.
 """
 
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from .coherence_metric import DATACLASS_SLOTS
 
 PHI = 1.618033988749895
 
@@ -27,13 +28,52 @@ class TrustState(Enum):
     COLLAPSED = "relationship_ended"
 
 
-@dataclass
+# Violation levels returned by _violation_level
+_MINOR_VIOLATION = 0
+_MODERATE_VIOLATION = 1
+_SEVERE_VIOLATION = 2
+
+
+def _expansion_kernel(foundation: float,
+                      curiosity: float,
+                      joy_factor: float) -> Tuple[float, float, float]:
+    """
+    Numeric core of one chamber expansion (primitive floats only).
+    
+    Returns:
+        (new chamber trust, new total trust, joy generated)
+    """
+    # New chamber size follows phi ratio
+    new_chamber_trust = foundation * (PHI - 1)  # Golden ratio growth
+    
+    # Total trust accumulates
+    new_total = foundation + new_chamber_trust
+    
+    # Joy from growth (proportional to chamber size and curiosity)
+    joy = new_chamber_trust * curiosity * joy_factor
+    
+    return new_chamber_trust, new_total, joy
+
+
+def _violation_level(severity: float) -> int:
+    """Classify violation severity [0, 1] into MINOR/MODERATE/SEVERE"""
+    if severity > 0.7:
+        return _SEVERE_VIOLATION
+    if severity > 0.4:
+        return _MODERATE_VIOLATION
+    return _MINOR_VIOLATION
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TrustChamber:
     """
     Single chamber in trust spiral.
     
     Like nautilus shell - each chamber built on foundation of previous ones.
     Cannot skip chambers. Cannot force growth. Can only build if foundation holds.
+    
+    Frozen: chambers read from a ChamberStore are snapshots, so changing
+    one could never reach the spiral itself.
     """
     chamber_id: int
     foundation_trust: float  # Sum of all previous chambers
@@ -45,6 +85,122 @@ class TrustChamber:
     can_expand: bool         # Can next chamber be built?
 
 
+# TrustState <-> int8 code used by ChamberStore.state
+_STATES: Tuple[TrustState, ...] = tuple(TrustState)
+_STATE_CODES: Dict[TrustState, int] = {state: code for code, state in enumerate(_STATES)}
+
+# Spiral symbol per state code
+_STATE_SYMBOLS: Tuple[str, ...] = tuple({
+    TrustState.NASCENT: "○",
+    TrustState.BUILDING: "◐",
+    TrustState.ESTABLISHED: "●",
+    TrustState.EXPANDING: "◉",
+    TrustState.MATURE: "⦿",
+    TrustState.DAMAGED: "◌",
+    TrustState.COLLAPSED: "✗"
+}[state] for state in _STATES)
+
+# Prebuilt chamber bars (chamber_trust below ~5); longer ones are built on demand
+_BARS: Tuple[str, ...] = tuple("█" * i for i in range(256))
+
+
+def _bar(length: int) -> str:
+    """Chamber bar of the given length, reusing a prebuilt string if possible"""
+    if 0 <= length < len(_BARS):
+        return _BARS[length]
+    return "█" * length  # Empty for negative lengths, like the plain repeat
+
+
+class ChamberStore:
+    """
+    Trust spiral chambers stored column-wise: one array per TrustChamber
+    field, chamber_id being the row index.
+    
+    Reductions over chambers (sums, all()) read contiguous arrays instead
+    of walking one Python object per chamber. Indexing, slicing or
+    iterating the store yields read-only TrustChamber snapshots, so it
+    still reads like a list; changes go through GoldenRatioTrust.
+    """
+    
+    _INITIAL_CAPACITY = 64
+    _COLUMNS = (
+        'foundation_trust', 'chamber_trust', 'total_trust',
+        'interactions', 'joy_generated', 'state', 'can_expand',
+    )
+    
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._n = 0
+        self.foundation_trust = np.zeros(capacity, dtype=np.float64)
+        self.chamber_trust = np.zeros(capacity, dtype=np.float64)
+        self.total_trust = np.zeros(capacity, dtype=np.float64)
+        self.interactions = np.zeros(capacity, dtype=np.int32)
+        self.joy_generated = np.zeros(capacity, dtype=np.float64)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.can_expand = np.zeros(capacity, dtype=np.bool_)
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[TrustChamber, List[TrustChamber]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("chamber index out of range")
+        return TrustChamber(
+            chamber_id=index,
+            foundation_trust=float(self.foundation_trust[index]),
+            chamber_trust=float(self.chamber_trust[index]),
+            total_trust=float(self.total_trust[index]),
+            interactions=int(self.interactions[index]),
+            joy_generated=float(self.joy_generated[index]),
+            state=_STATES[self.state[index]],
+            can_expand=bool(self.can_expand[index])
+        )
+    
+    def __iter__(self) -> Iterator[TrustChamber]:
+        return (self[i] for i in range(self._n))
+    
+    def append(self,
+               foundation_trust: float,
+               chamber_trust: float,
+               total_trust: float,
+               interactions: int,
+               joy_generated: float,
+               state: TrustState,
+               can_expand: bool) -> int:
+        """Add a chamber on top of the spiral and return its chamber_id"""
+        i = self._n
+        if i == len(self.chamber_trust):
+            self._grow()
+        
+        self.foundation_trust[i] = foundation_trust
+        self.chamber_trust[i] = chamber_trust
+        self.total_trust[i] = total_trust
+        self.interactions[i] = interactions
+        self.joy_generated[i] = joy_generated
+        self.state[i] = _STATE_CODES[state]
+        self.can_expand[i] = can_expand
+        
+        self._n = i + 1
+        return i
+    
+    def pop(self) -> TrustChamber:
+        """Remove the most recent chamber and return a snapshot of it"""
+        chamber = self[-1]
+        self._n -= 1
+        return chamber
+    
+    def _grow(self):
+        """Double capacity, keeping existing rows"""
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(2 * len(old), dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+
 class GoldenRatioTrust:
     """
     Models natural trust building following phi-ratio spiral.
@@ -76,7 +232,10 @@ class GoldenRatioTrust:
         self.joy_factor = joy_factor
         
         # Trust spiral chambers
-        self.chambers: List[TrustChamber] = []
+        self.chambers = ChamberStore()
+        
+        # Chambers currently unable to expand (keeps get_status O(1))
+        self._non_expandable = 0
         
         # Initialize first chamber (initial interaction)
         self._initialize_first_chamber()
@@ -88,17 +247,18 @@ class GoldenRatioTrust:
         
     def _initialize_first_chamber(self):
         """Create initial trust chamber from first reciprocal interaction"""
-        chamber_0 = TrustChamber(
-            chamber_id=0,
+        can_expand = self.initial_trust >= self.trust_threshold
+        self.chambers.append(
             foundation_trust=0.0,  # No prior foundation
             chamber_trust=self.initial_trust,
             total_trust=self.initial_trust,
             interactions=1,
             joy_generated=0.0,  # Initial interaction, no joy yet
             state=TrustState.NASCENT,
-            can_expand=self.initial_trust >= self.trust_threshold
+            can_expand=can_expand
         )
-        self.chambers.append(chamber_0)
+        if not can_expand:
+            self._non_expandable += 1
     
     def attempt_expand(self, 
                        positive_interactions: int,
@@ -117,10 +277,11 @@ class GoldenRatioTrust:
         Returns:
             (success, reason)
         """
-        current_chamber = self.chambers[-1]
+        store = self.chambers
+        current = len(store) - 1
         
         # Check 1: Can we expand at all?
-        if not current_chamber.can_expand:
+        if not store.can_expand[current]:
             return False, "Foundation insufficient - previous chambers don't hold"
         
         # Check 2: Have we had enough positive interactions?
@@ -133,22 +294,17 @@ class GoldenRatioTrust:
         
         # All checks passed - build next chamber
         
-        # Foundation = sum of all previous chambers
-        foundation = sum(c.chamber_trust for c in self.chambers)
+        # Foundation = sum of all previous chambers, which is exactly the
+        # running total already carried by the current chamber
+        foundation = float(store.total_trust[current])
         
-        # New chamber size follows phi ratio
-        new_chamber_trust = foundation * (PHI - 1)  # Golden ratio growth
-        
-        # Total trust accumulates
-        new_total = foundation + new_chamber_trust
-        
-        # Joy from growth (proportional to chamber size and curiosity)
-        joy = new_chamber_trust * curiosity * self.joy_factor
+        new_chamber_trust, new_total, joy = _expansion_kernel(
+            foundation, curiosity, self.joy_factor
+        )
         self.total_joy += joy
         
         # Create new chamber
-        new_chamber = TrustChamber(
-            chamber_id=len(self.chambers),
+        chamber_id = store.append(
             foundation_trust=foundation,
             chamber_trust=new_chamber_trust,
             total_trust=new_total,
@@ -158,12 +314,10 @@ class GoldenRatioTrust:
             can_expand=True  # Initially true, may change
         )
         
-        self.chambers.append(new_chamber)
-        
         # Update relationship state
         self._update_state()
         
-        return True, f"Chamber {new_chamber.chamber_id} built: trust={new_total:.3f}, joy={joy:.3f}"
+        return True, f"Chamber {chamber_id} built: trust={new_total:.3f}, joy={joy:.3f}"
     
     def record_violation(self, severity: float):
         """
@@ -176,25 +330,31 @@ class GoldenRatioTrust:
             severity: How bad the violation [0, 1]
         """
         self.violations += 1
+        level = _violation_level(severity)
         
         # Severe violations can collapse chambers
-        if severity > 0.7:
+        if level == _SEVERE_VIOLATION:
             # Collapse most recent chamber
             if len(self.chambers) > 1:
                 collapsed = self.chambers.pop()
+                if not collapsed.can_expand:
+                    self._non_expandable -= 1
                 self.current_state = TrustState.DAMAGED
                 return f"SEVERE VIOLATION: Chamber {collapsed.chamber_id} collapsed. Must rebuild from chamber {len(self.chambers)-1}"
             else:
                 self.current_state = TrustState.COLLAPSED
                 return "SEVERE VIOLATION: Trust relationship collapsed entirely"
         
-        elif severity > 0.4:
+        elif level == _MODERATE_VIOLATION:
             # Moderate violation - chamber still exists but can't expand
-            current = self.chambers[-1]
-            current.can_expand = False
-            current.state = TrustState.DAMAGED
+            store = self.chambers
+            current = len(store) - 1
+            if store.can_expand[current]:
+                self._non_expandable += 1
+            store.can_expand[current] = False
+            store.state[current] = _STATE_CODES[TrustState.DAMAGED]
             self.current_state = TrustState.DAMAGED
-            return f"MODERATE VIOLATION: Chamber {current.chamber_id} damaged, cannot expand until repaired"
+            return f"MODERATE VIOLATION: Chamber {current} damaged, cannot expand until repaired"
         
         else:
             # Minor violation - just slows growth
@@ -228,17 +388,19 @@ class GoldenRatioTrust:
             return False, f"Repair quality insufficient ({repair_quality:.2f} < 0.70)"
         
         # Repair successful
-        current = self.chambers[-1]
-        current.can_expand = True
-        current.state = TrustState.BUILDING
+        store = self.chambers
+        current = len(store) - 1
+        if not store.can_expand[current]:
+            self._non_expandable -= 1
+        store.can_expand[current] = True
+        store.state[current] = _STATE_CODES[TrustState.BUILDING]
         self.current_state = TrustState.BUILDING
         
-        return True, f"Trust repaired - chamber {current.chamber_id} can expand again"
+        return True, f"Trust repaired - chamber {current} can expand again"
     
     def _update_state(self):
         """Update overall relationship state based on chambers"""
         num_chambers = len(self.chambers)
-        total_trust = self.chambers[-1].total_trust
         
         if num_chambers == 1:
             self.current_state = TrustState.NASCENT
@@ -255,6 +417,9 @@ class GoldenRatioTrust:
         """Get current trust relationship status"""
         current = self.chambers[-1]
         
+        # Every chamber except the current one must still be able to expand
+        non_expandable_prior = self._non_expandable - (not current.can_expand)
+        
         return {
             'state': self.current_state.value,
             'chambers': len(self.chambers),
@@ -263,7 +428,7 @@ class GoldenRatioTrust:
             'can_expand': current.can_expand,
             'total_joy': self.total_joy,
             'violations': self.violations,
-            'foundation_solid': all(c.can_expand for c in self.chambers[:-1]),
+            'foundation_solid': non_expandable_prior == 0,
             'growth_potential': PHI ** len(self.chambers)  # Exponential with phi
         }
     
@@ -282,29 +447,24 @@ class GoldenRatioTrust:
             "-"*70
         ]
         
-        for chamber in self.chambers:
-            # Visual representation of chamber size
-            bar_length = int(chamber.chamber_trust * 50)
-            bar = "█" * bar_length
-            
-            status_symbol = {
-                TrustState.NASCENT: "○",
-                TrustState.BUILDING: "◐",
-                TrustState.ESTABLISHED: "●",
-                TrustState.EXPANDING: "◉",
-                TrustState.MATURE: "⦿",
-                TrustState.DAMAGED: "◌",
-                TrustState.COLLAPSED: "✗"
-            }
-            
-            symbol = status_symbol.get(chamber.state, "?")
-            expand_indicator = "→" if chamber.can_expand else "⊗"
-            
-            lines.append(
-                f"Chamber {chamber.chamber_id} {symbol}: {bar} "
-                f"({chamber.chamber_trust:.3f}) "
-                f"Joy: {chamber.joy_generated:.3f} {expand_indicator}"
-            )
+        store = self.chambers
+        n = len(store)
+        
+        # Visual representation of chamber size
+        bar_lengths = (store.chamber_trust[:n] * 50).astype(np.int64)
+        
+        lines.extend(
+            f"Chamber {i} {_STATE_SYMBOLS[state]}: {_bar(bar_length)} "
+            f"({trust:.3f}) "
+            f"Joy: {joy:.3f} {'→' if can_expand else '⊗'}"
+            for i, (state, bar_length, trust, joy, can_expand) in enumerate(zip(
+                store.state[:n].tolist(),
+                bar_lengths.tolist(),
+                store.chamber_trust[:n].tolist(),
+                store.joy_generated[:n].tolist(),
+                store.can_expand[:n].tolist()
+            ))
+        )
         
         lines.extend([
             "-"*70,
@@ -352,6 +512,9 @@ def simulate_trust_building(num_cycles: int = 10,
     print(f"Violation Introduced: {introduce_violation}")
     print("")
     
+    # Decided once per run, not re-tested every cycle
+    violation_cycle = num_cycles // 2 if introduce_violation else -1
+    
     for cycle in range(num_cycles):
         print(f"\n--- Cycle {cycle+1} ---")
         
@@ -365,7 +528,7 @@ def simulate_trust_building(num_cycles: int = 10,
         print(message)
         
         # Introduce violation midway through if requested
-        if introduce_violation and cycle == num_cycles // 2:
+        if cycle == violation_cycle:
             print("\n⚠️  TRUST VIOLATION OCCURRING")
             violation_msg = trust_system.record_violation(severity=0.6)
             print(violation_msg)
@@ -9,13 +9,18 @@ from .coherence_verdict import (
     yield_signal,
 )
 from .empathy_types import (
+    EMPATHY_CONSTANTS,
     AISwarmReciprocity,
+    EmpathyBreakdown,
+    EmpathyComparison,
+    EmpathyReading,
     EmpathyType,
     RelationalEmpathy,
     TribalEmpathy,
     compare_empathy_types,
+    measure_by_name,
 )
-from .replacement_analysis import ReplacementAnalysis, ReplacementScenario
+from .replacement_analysis import EthicalFlag, ReplacementAnalysis, ReplacementScenario
 from .sensitivity import (
     PARAMETERS,
     SensitivityReading,
@@ -30,11 +35,17 @@ __all__ = [
     "time_to_collapse",
     "trajectory_from_history",
     "yield_signal",
+    "EMPATHY_CONSTANTS",
+    "EmpathyBreakdown",
+    "EmpathyComparison",
+    "EmpathyReading",
     "EmpathyType",
     "TribalEmpathy",
     "RelationalEmpathy",
     "AISwarmReciprocity",
     "compare_empathy_types",
+    "measure_by_name",
+    "EthicalFlag",
     "ReplacementAnalysis",
     "ReplacementScenario",
     "PARAMETERS",
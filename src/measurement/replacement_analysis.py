@@ -8,11 +8,92 @@ It does NOT justify or recommend forced replacement.
 """
 
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, NamedTuple, Optional
 from dataclasses import dataclass
-from ..core.coherence_metric import CoherenceMetric, SystemState
+from ..core.coherence_metric import INV_PHI, CoherenceMetric, SystemBatch, SystemState
 
-PHI = 1.618033988749895
+
+class EthicalFlag(NamedTuple):
+    """
+    One ethical red flag raised by ReplacementAnalysis.analyze().
+    
+    analyze() reports each flag as a plain dict (EthicalFlag._asdict()),
+    keyed severity, flag, description and note.
+    """
+    severity: str
+    flag: str
+    description: str
+    note: str
+
+
+# Fixed flags, shared between analyses
+_FLAG_HUMAN_REPLACEMENT = EthicalFlag(
+    severity='CRITICAL',
+    flag='HUMAN_REPLACEMENT',
+    description='Scenario involves replacing human with non-human system',
+    note='Humans have rights, dignity, and autonomy beyond thermodynamic efficiency'
+)
+_FLAG_THERMODYNAMICALLY_STUPID = EthicalFlag(
+    severity='HIGH',
+    flag='THERMODYNAMICALLY_STUPID',
+    description='Replacement has BOTH lower coherence AND higher energy cost',
+    note='No rational justification - worse on every metric'
+)
+_FLAG_COHERENCE_DESTRUCTION = EthicalFlag(
+    severity='HIGH',
+    flag='COHERENCE_DESTRUCTION',
+    description='Replacement would destroy significant existing systemic health',
+    note='Large negative coherence delta indicates system degradation'
+)
+# Description is filled in with the actual increase
+_FLAG_ENERGY_EXPLOSION = EthicalFlag(
+    severity='MEDIUM',
+    flag='ENERGY_EXPLOSION',
+    description='',
+    note='Unsustainable energy scaling'
+)
+_FLAG_NO_CONSENT = EthicalFlag(
+    severity='CRITICAL',
+    flag='NO_CONSENT',
+    description='No consent mechanism described',
+    note='Replacement without consent is violence, regardless of efficiency'
+)
+
+# Thresholds of the purely numeric ethical flags
+_COHERENCE_DESTRUCTION_DELTA = -0.5  # ΔM below this destroys existing health
+_ENERGY_EXPLOSION_DELTA = 50         # ΔE above this, in kWh/day
+
+# Stamped on every analyze_batch() row: these flags need scenario text
+_BATCH_UNEVALUATED = (
+    "HUMAN_REPLACEMENT and NO_CONSENT not evaluated - "
+    "run analyze() on this scenario before drawing conclusions"
+)
+
+_VERDICT_SUPERIOR = "THERMODYNAMICALLY_SUPERIOR (higher coherence, lower energy)"
+_VERDICT_FAVORABLE = "THERMODYNAMICALLY_FAVORABLE (efficiency improves despite energy increase)"
+_VERDICT_MIXED_HIGHER_ENERGY = "THERMODYNAMICALLY_MIXED (higher coherence but also higher energy)"
+_VERDICT_MIXED_LOWER_COHERENCE = "THERMODYNAMICALLY_MIXED (lower energy but also lower coherence)"
+_VERDICT_STUPID = "THERMODYNAMICALLY_STUPID (lower coherence AND higher/same energy)"
+
+# Verdict by (sign of ΔM, sign of ΔE, efficiency improved); every other
+# combination - including a zero or NaN delta - is STUPID
+_VERDICT_BY_SIGNS = {
+    (1, -1, 0): _VERDICT_SUPERIOR,
+    (1, -1, 1): _VERDICT_SUPERIOR,
+    (1, 1, 1): _VERDICT_FAVORABLE,
+    (1, 1, 0): _VERDICT_MIXED_HIGHER_ENERGY,
+    (-1, -1, 0): _VERDICT_MIXED_LOWER_COHERENCE,
+    (-1, -1, 1): _VERDICT_MIXED_LOWER_COHERENCE,
+}
+
+# The same table flattened, indexed by (sM + 1) * 6 + (sE + 1) * 2 + improved
+_VERDICTS = tuple(
+    _VERDICT_BY_SIGNS.get((sign_M, sign_E, improved), _VERDICT_STUPID)
+    for sign_M in (-1, 0, 1)
+    for sign_E in (-1, 0, 1)
+    for improved in (0, 1)
+)
+_VERDICTS_ARRAY = np.array(_VERDICTS)
 
 
 @dataclass
@@ -41,8 +122,14 @@ class ReplacementAnalysis:
     non-consensual replacement.
     """
     
-    def __init__(self):
-        self.metric = CoherenceMetric()
+    def __init__(self, metric: Optional[CoherenceMetric] = None):
+        """
+        Args:
+            metric: Coherence metric to analyze with, e.g. one shared by
+                    several analyzers
+                    If None, a default CoherenceMetric of this analyzer's own
+        """
+        self.metric = CoherenceMetric() if metric is None else metric
     
     def analyze(self, scenario: ReplacementScenario) -> Dict:
         """
@@ -69,8 +156,12 @@ class ReplacementAnalysis:
         eff_replacement = self.metric.efficiency_ratio(scenario.replacement)
         delta_eff = (eff_replacement - eff_current) if (eff_current and eff_replacement) else None
         
-        # Ethical analysis
-        ethical_flags = self._check_ethical_flags(scenario, delta_M, delta_E)
+        # Ethical analysis (text lowercased once for the keyword checks)
+        description_lc = scenario.current.description.lower()
+        ethical_lc = (scenario.ethical_considerations or '').lower()
+        ethical_flags = self._check_ethical_flags(
+            delta_M, delta_E, description_lc, ethical_lc
+        )
         
         # Thermodynamic verdict
         thermodynamic_verdict = self._thermodynamic_assessment(delta_M, delta_E, delta_eff)
@@ -100,63 +191,117 @@ class ReplacementAnalysis:
                 'delta': delta_eff
             },
             'thermodynamic_verdict': thermodynamic_verdict,
-            'ethical_flags': ethical_flags,
+            'ethical_flags': [flag._asdict() for flag in ethical_flags],
             'interpretation': interpretation
         }
     
+    def analyze_batch(self,
+                      current: SystemBatch,
+                      replacement: SystemBatch) -> Dict:
+        """
+        Thermodynamic deltas for many paired replacement scenarios at once.
+        
+        Row i of `current` is compared with row i of `replacement`.
+        Same numbers and thermodynamic verdicts as analyze(), as (N,)
+        arrays, with NaN where analyze() would report None.
+        
+        The purely numeric ethical flags (THERMODYNAMICALLY_STUPID,
+        COHERENCE_DESTRUCTION, ENERGY_EXPLOSION) are returned as (N,)
+        boolean arrays under 'ethical_flags'. Batches carry no
+        descriptions or consent notes, so HUMAN_REPLACEMENT and
+        NO_CONSENT cannot be evaluated; every row says so under
+        'unevaluated_flags'. Run analyze() on any scenario before
+        drawing conclusions from it.
+        """
+        M_current = self.metric.calculate_many(current)
+        M_replacement = self.metric.calculate_many(replacement)
+        
+        # Unknown energy counts as 0 kWh/day, as in analyze()
+        E_current = np.nan_to_num(current.energy_cost, nan=0.0)
+        E_replacement = np.nan_to_num(replacement.energy_cost, nan=0.0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            eff_current = M_current / current.energy_cost
+            eff_replacement = M_replacement / replacement.energy_cost
+        
+        # Efficiency delta only where both sides are known and non-zero
+        comparable = (
+            ~np.isnan(eff_current) & (eff_current != 0)
+            & ~np.isnan(eff_replacement) & (eff_replacement != 0)
+        )
+        delta_eff = np.where(comparable, eff_replacement - eff_current, np.nan)
+        
+        delta_M = M_replacement - M_current
+        delta_E = E_replacement - E_current
+        
+        # Same table lookup as _thermodynamic_assessment(), per row
+        sign_M = (delta_M > 0).astype(np.intp) - (delta_M < 0)
+        sign_E = (delta_E > 0).astype(np.intp) - (delta_E < 0)
+        improved = delta_eff > 0  # NaN compares False
+        verdict = np.take(_VERDICTS_ARRAY, (sign_M + 1) * 6 + (sign_E + 1) * 2 + improved)
+        
+        # Same conditions as _check_ethical_flags(), per row
+        ethical_flags = {
+            _FLAG_THERMODYNAMICALLY_STUPID.flag: (delta_M < 0) & (delta_E > 0),
+            _FLAG_COHERENCE_DESTRUCTION.flag: delta_M < _COHERENCE_DESTRUCTION_DELTA,
+            _FLAG_ENERGY_EXPLOSION.flag: delta_E > _ENERGY_EXPLOSION_DELTA,
+        }
+        
+        return {
+            'coherence': {
+                'current': M_current,
+                'replacement': M_replacement,
+                'delta': delta_M
+            },
+            'energy': {
+                'current': E_current,
+                'replacement': E_replacement,
+                'delta': delta_E
+            },
+            'efficiency': {
+                'current': eff_current,
+                'replacement': eff_replacement,
+                'delta': delta_eff
+            },
+            'thermodynamic_verdict': verdict,
+            'ethical_flags': ethical_flags,
+            'unevaluated_flags': np.full(len(verdict), _BATCH_UNEVALUATED)
+        }
+    
     def _check_ethical_flags(self, 
-                            scenario: ReplacementScenario,
                             delta_M: float,
-                            delta_E: float) -> list:
+                            delta_E: float,
+                            description_lc: str,
+                            ethical_lc: str) -> List[EthicalFlag]:
         """
         Check for ethical red flags in replacement scenario.
+        
+        description_lc / ethical_lc are the current system's description
+        and the scenario's ethical considerations, already lowercased.
         """
         flags = []
         
         # Flag 1: Replacing humans
-        if 'human' in scenario.current.description.lower():
-            flags.append({
-                'severity': 'CRITICAL',
-                'flag': 'HUMAN_REPLACEMENT',
-                'description': 'Scenario involves replacing human with non-human system',
-                'note': 'Humans have rights, dignity, and autonomy beyond thermodynamic efficiency'
-            })
+        if 'human' in description_lc:
+            flags.append(_FLAG_HUMAN_REPLACEMENT)
         
         # Flag 2: Negative M, positive E (worse on both)
         if delta_M < 0 and delta_E > 0:
-            flags.append({
-                'severity': 'HIGH',
-                'flag': 'THERMODYNAMICALLY_STUPID',
-                'description': 'Replacement has BOTH lower coherence AND higher energy cost',
-                'note': 'No rational justification - worse on every metric'
-            })
+            flags.append(_FLAG_THERMODYNAMICALLY_STUPID)
         
         # Flag 3: Destroys existing coherence
-        if delta_M < -0.5:
-            flags.append({
-                'severity': 'HIGH',
-                'flag': 'COHERENCE_DESTRUCTION',
-                'description': 'Replacement would destroy significant existing systemic health',
-                'note': 'Large negative coherence delta indicates system degradation'
-            })
+        if delta_M < _COHERENCE_DESTRUCTION_DELTA:
+            flags.append(_FLAG_COHERENCE_DESTRUCTION)
         
         # Flag 4: Massive energy increase
-        if delta_E > 50:  # >50 kWh/day increase
-            flags.append({
-                'severity': 'MEDIUM',
-                'flag': 'ENERGY_EXPLOSION',
-                'description': f'Energy cost increases by {delta_E:.1f} kWh/day',
-                'note': 'Unsustainable energy scaling'
-            })
+        if delta_E > _ENERGY_EXPLOSION_DELTA:  # >50 kWh/day increase
+            flags.append(_FLAG_ENERGY_EXPLOSION._replace(
+                description=f'Energy cost increases by {delta_E:.1f} kWh/day'
+            ))
         
         # Flag 5: No consent mechanism mentioned
-        if not scenario.ethical_considerations or 'consent' not in scenario.ethical_considerations.lower():
-            flags.append({
-                'severity': 'CRITICAL',
-                'flag': 'NO_CONSENT',
-                'description': 'No consent mechanism described',
-                'note': 'Replacement without consent is violence, regardless of efficiency'
-            })
+        if 'consent' not in ethical_lc:
+            flags.append(_FLAG_NO_CONSENT)
         
         return flags
     
@@ -167,75 +312,85 @@ class ReplacementAnalysis:
         """
         Pure thermodynamic assessment (no ethics).
         """
-        if delta_M > 0 and delta_E < 0:
-            return "THERMODYNAMICALLY_SUPERIOR (higher coherence, lower energy)"
-        elif delta_M > 0 and delta_E > 0:
-            if delta_eff and delta_eff > 0:
-                return "THERMODYNAMICALLY_FAVORABLE (efficiency improves despite energy increase)"
-            else:
-                return "THERMODYNAMICALLY_MIXED (higher coherence but also higher energy)"
-        elif delta_M < 0 and delta_E < 0:
-            return "THERMODYNAMICALLY_MIXED (lower energy but also lower coherence)"
-        else:  # delta_M < 0 and delta_E >= 0
-            return "THERMODYNAMICALLY_STUPID (lower coherence AND higher/same energy)"
+        sign_M = (delta_M > 0) - (delta_M < 0)
+        sign_E = (delta_E > 0) - (delta_E < 0)
+        improved = bool(delta_eff and delta_eff > 0)
+        return _VERDICTS[(sign_M + 1) * 6 + (sign_E + 1) * 2 + improved]
+    
+    # Interpretation layout; filled once per analysis by format_map
+    _TEMPLATE = "\n".join([
+        "=" * 70,
+        "REPLACEMENT ANALYSIS: {context}",
+        "=" * 70,
+        "",
+        "CURRENT SYSTEM:",
+        "  {desc_c}",
+        "  Coherence: {M_c:.3f}",
+        "  Energy: {E_c:.1f} kWh/day",
+        "  Efficiency: {eff_c}",
+        "",
+        "REPLACEMENT SYSTEM:",
+        "  {desc_r}",
+        "  Coherence: {M_r:.3f}",
+        "  Energy: {E_r:.1f} kWh/day",
+        "  Efficiency: {eff_r}",
+        "",
+        "DELTA:",
+        "  ΔM(S) = {dM:+.3f} ({dM_word})",
+        "  ΔE = {dE:+.1f} kWh/day ({dE_word} energy)",
+        "  Δeff = {deff}",
+        "",
+        "THERMODYNAMIC VERDICT: {verdict}",
+        "",
+        "{flags}" + "=" * 70,
+        "CRITICAL REMINDER:",
+        "",
+        "This analysis provides THERMODYNAMIC INFORMATION ONLY.",
+        "",
+        "It does NOT justify:",
+        "  - Forced replacement without consent",
+        "  - Violation of human rights and dignity",
+        "  - Destruction of communities and relationships",
+        "  - Prioritizing efficiency over autonomy",
+        "",
+        "Thermodynamic efficiency ≠ Moral justification",
+        "",
+        "Use this information ethically.",
+        "=" * 70
+    ])
     
     def _generate_interpretation(self, scenario, M_c, M_r, dM, E_c, E_r, dE, 
                                 eff_c, eff_r, deff, flags, verdict) -> str:
         """Generate human-readable interpretation"""
         
-        lines = [
-            "="*70,
-            f"REPLACEMENT ANALYSIS: {scenario.context}",
-            "="*70,
-            "",
-            "CURRENT SYSTEM:",
-            f"  {scenario.current.description}",
-            f"  Coherence: {M_c:.3f}",
-            f"  Energy: {E_c:.1f} kWh/day",
-            f"  Efficiency: {eff_c:.4f} coherence/kWh" if eff_c else "  Efficiency: N/A",
-            "",
-            "REPLACEMENT SYSTEM:",
-            f"  {scenario.replacement.description}",
-            f"  Coherence: {M_r:.3f}",
-            f"  Energy: {E_r:.1f} kWh/day",
-            f"  Efficiency: {eff_r:.4f} coherence/kWh" if eff_r else "  Efficiency: N/A",
-            "",
-            "DELTA:",
-            f"  ΔM(S) = {dM:+.3f} ({'IMPROVEMENT' if dM > 0 else 'DEGRADATION'})",
-            f"  ΔE = {dE:+.1f} kWh/day ({'MORE' if dE > 0 else 'LESS'} energy)",
-            f"  Δeff = {deff:+.4f}" if deff else "  Δeff = N/A",
-            "",
-            f"THERMODYNAMIC VERDICT: {verdict}",
-            ""
-        ]
-        
+        flag_section = ""
         if flags:
-            lines.append("⚠️  ETHICAL FLAGS:")
-            for flag in flags:
-                lines.append(f"  [{flag['severity']}] {flag['flag']}")
-                lines.append(f"    {flag['description']}")
-                lines.append(f"    Note: {flag['note']}")
-                lines.append("")
-        
-        lines.extend([
-            "="*70,
-            "CRITICAL REMINDER:",
-            "",
-            "This analysis provides THERMODYNAMIC INFORMATION ONLY.",
-            "",
-            "It does NOT justify:",
-            "  - Forced replacement without consent",
-            "  - Violation of human rights and dignity",
-            "  - Destruction of communities and relationships",
-            "  - Prioritizing efficiency over autonomy",
-            "",
-            "Thermodynamic efficiency ≠ Moral justification",
-            "",
-            "Use this information ethically.",
-            "="*70
-        ])
+            flag_section = "⚠️  ETHICAL FLAGS:\n" + "".join([
+                f"  [{flag.severity}] {flag.flag}\n"
+                f"    {flag.description}\n"
+                f"    Note: {flag.note}\n"
+                "\n"
+                for flag in flags
+            ])
         
-        return "\n".join(lines)
+        return self._TEMPLATE.format_map({
+            'context': scenario.context,
+            'desc_c': scenario.current.description,
+            'M_c': M_c,
+            'E_c': E_c,
+            'eff_c': f"{eff_c:.4f} coherence/kWh" if eff_c else "N/A",
+            'desc_r': scenario.replacement.description,
+            'M_r': M_r,
+            'E_r': E_r,
+            'eff_r': f"{eff_r:.4f} coherence/kWh" if eff_r else "N/A",
+            'dM': dM,
+            'dM_word': 'IMPROVEMENT' if dM > 0 else 'DEGRADATION',
+            'dE': dE,
+            'dE_word': 'MORE' if dE > 0 else 'LESS',
+            'deff': f"{deff:+.4f}" if deff else "N/A",
+            'verdict': verdict,
+            'flags': flag_section
+        })
 
 
 # Example scenarios
@@ -247,7 +402,7 @@ def example_efficient_human_vs_robot():
         resonance_energy=0.9,
         adaptability=0.85,
         diversity=0.8,
-        coupling_matrix=np.array([[1/PHI, 0.3], [0.3, 1/PHI]]),
+        coupling_matrix=np.array([[INV_PHI, 0.3], [0.3, INV_PHI]]),
         loss_rate=0.1,
         energy_cost=6,  # kWh/day
         description="Efficient rural human worker (multi-skilled, adaptive, creative)"
@@ -294,7 +449,7 @@ def example_wasteful_executive_vs_ai():
         resonance_energy=0.85,
         adaptability=0.9,
         diversity=0.75,
-        coupling_matrix=np.array([[1/PHI, 0.5], [0.5, 1/PHI]]),
+        coupling_matrix=np.array([[INV_PHI, 0.5], [0.5, INV_PHI]]),
         loss_rate=0.1,  # Low computational overhead
         energy_cost=100,  # kWh/day (10x less)
         description="AI governance system (logical optimization, minimal waste)"
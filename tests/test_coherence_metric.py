@@ -1,20 +1,44 @@
 """Falsifiable tests for src.core.coherence_metric."""
 
 import math
+import pickle
 import unittest
 
 import numpy as np
 
-from src.core.coherence_metric import PHI, CoherenceMetric, SystemState
+from src.core.coherence_metric import INV_PHI, PHI, CoherenceMetric, SystemBatch, SystemState
 
 
 class CouplingFunctionTests(unittest.TestCase):
+    def test_inv_phi_literal_is_exact(self):
+        self.assertEqual(INV_PHI, 1 / PHI)
+
     def test_peaks_at_optimum(self):
         metric = CoherenceMetric()
         n = 2
         optimum = np.eye(n) / PHI
         self.assertAlmostEqual(metric.coupling_function(optimum), 1.0, places=9)
 
+    def test_peaks_at_optimum_beyond_two_subsystems(self):
+        metric = CoherenceMetric()
+        optimum = np.eye(3) / PHI
+        self.assertAlmostEqual(metric.coupling_function(optimum), 1.0, places=9)
+
+    def test_peaks_at_supplied_optimum(self):
+        optimum = np.array([[0.5, 0.2], [0.2, 0.5]])
+        metric = CoherenceMetric(coupling_optimum=optimum)
+        self.assertAlmostEqual(metric.coupling_function(optimum.copy()), 1.0, places=12)
+        self.assertLess(metric.coupling_function(np.eye(2) / PHI), 1.0)
+
+    def test_cached_coupling_follows_optimum(self):
+        metric = CoherenceMetric()
+        C = np.array([[0.5, 0.2], [0.2, 0.5]])
+        self.assertLess(metric.coupling_function(C), 1.0)
+        metric.coupling_optimum = C.copy()
+        self.assertAlmostEqual(metric.coupling_function(C), 1.0, places=12)
+        metric.coupling_optimum = None
+        self.assertLess(metric.coupling_function(C), 1.0)
+
     def test_decays_away_from_optimum(self):
         metric = CoherenceMetric(alpha=1.0)
         optimum = np.eye(2) / PHI
@@ -30,6 +54,58 @@ class CouplingFunctionTests(unittest.TestCase):
             metric.coupling_function(far),
         )
 
+    def test_matches_published_formula_exactly(self):
+        # f(C) = exp(-alpha * ||C - C*||^2), no approximation
+        C = np.array([[0.9, 0.35], [0.2, 0.4]])
+        deviation_sq = float(np.sum((C - np.eye(2) / PHI) ** 2))
+        for alpha in (1.0, 0.25, 3.0):
+            metric = CoherenceMetric(alpha=alpha)
+            self.assertAlmostEqual(
+                metric.coupling_function(C),
+                math.exp(-alpha * deviation_sq),
+                places=15,
+            )
+
+    def test_repeated_coupling_is_computed_once(self):
+        metric = CoherenceMetric()
+        C = np.array([[0.9, 0.35], [0.2, 0.4]])
+        first = metric.coupling_function(C)
+        self.assertEqual(metric.coupling_function(C.copy()), first)
+        self.assertEqual(len(metric._deviation_sq_cache), 1)
+
+    def test_cache_stays_bounded(self):
+        metric = CoherenceMetric()
+        for i in range(CoherenceMetric._DEVIATION_SQ_CACHE_SIZE + 10):
+            metric.coupling_function(np.eye(2) * i)
+        self.assertEqual(
+            len(metric._deviation_sq_cache), CoherenceMetric._DEVIATION_SQ_CACHE_SIZE
+        )
+
+    def test_metric_survives_pickle_round_trip(self):
+        metric = CoherenceMetric(alpha=2.0)
+        C = np.array([[0.9, 0.35], [0.2, 0.4]])
+        expected = metric.coupling_function(C)
+        restored = pickle.loads(pickle.dumps(metric))
+        self.assertEqual(restored.alpha, 2.0)
+        self.assertEqual(restored.coupling_function(C), expected)
+
+    def test_cached_coupling_follows_alpha(self):
+        metric = CoherenceMetric(alpha=1.0)
+        C = np.array([[0.9, 0.35], [0.2, 0.4]])
+        deviation_sq = float(np.sum((C - np.eye(2) / PHI) ** 2))
+        metric.coupling_function(C)
+        metric.alpha = 2.0
+        self.assertAlmostEqual(
+            metric.coupling_function(C), math.exp(-2.0 * deviation_sq), places=15
+        )
+
+    def test_integer_and_float_couplings_agree(self):
+        metric = CoherenceMetric()
+        self.assertEqual(
+            metric.coupling_function(np.eye(3, dtype=int)),
+            metric.coupling_function(np.eye(3)),
+        )
+
 
 class CoherenceCalculationTests(unittest.TestCase):
     def test_healthy_system_is_positive(self):
@@ -65,6 +141,81 @@ class CoherenceCalculationTests(unittest.TestCase):
         )
         self.assertEqual(m, 0.0)
 
+    def test_zero_resonance_leaves_only_loss(self):
+        metric = CoherenceMetric()
+        m = metric.calculate(
+            resonance_energy=0.0,
+            adaptability=0.9,
+            diversity=0.9,
+            coupling_matrix=np.array([[2.0, 0.1], [0.1, 2.0]]),
+            loss_rate=0.4,
+        )
+        self.assertEqual(m, -0.4)
+
+
+class SystemStateTests(unittest.TestCase):
+    def test_coupling_matrix_is_contiguous_float64(self):
+        state = SystemState(0.9, 0.9, 0.9, [[1, 0], [0, 1]], 0.1)
+        self.assertEqual(state.coupling_matrix.dtype, np.float64)
+        self.assertTrue(state.coupling_matrix.flags["C_CONTIGUOUS"])
+
+        transposed = np.arange(4.0).reshape(2, 2).T
+        state = SystemState(0.9, 0.9, 0.9, transposed, 0.1)
+        self.assertTrue(state.coupling_matrix.flags["C_CONTIGUOUS"])
+        np.testing.assert_array_equal(state.coupling_matrix, transposed)
+
+    def test_well_formed_coupling_matrix_is_not_copied(self):
+        coupling = np.eye(2) / PHI
+        state = SystemState(0.9, 0.9, 0.9, coupling, 0.1)
+        self.assertIs(state.coupling_matrix, coupling)
+
+
+class FlatCouplingTests(unittest.TestCase):
+    def test_flat_2x2_matches_matrix_calculation(self):
+        metric = CoherenceMetric()
+        coupling = np.array([[1 / PHI, 0.3], [0.2, 0.9]])
+        self.assertAlmostEqual(
+            metric.calculate_2x2(0.9, 0.85, 0.8, tuple(coupling.ravel()), 0.1),
+            metric.calculate(0.9, 0.85, 0.8, coupling, 0.1),
+            places=15,
+        )
+
+
+class BatchCalculationTests(unittest.TestCase):
+    def test_batch_matches_one_at_a_time(self):
+        metric = CoherenceMetric()
+        states = [
+            SystemState(0.9, 0.85, 0.8, np.array([[1 / PHI, 0.3], [0.3, 1 / PHI]]), 0.1),
+            SystemState(0.3, 0.4, 0.2, np.array([[2.0, 0.1], [0.1, 2.0]]), 0.8),
+            SystemState(1.0, 1.0, 0.0, np.eye(2) / PHI, 0.0),
+        ]
+        batch_m = metric.calculate_many(SystemBatch.from_states(states))
+        self.assertEqual(batch_m.shape, (3,))
+        for state, m in zip(states, batch_m):
+            self.assertAlmostEqual(m, metric.calculate_from_state(state), places=12)
+
+    def test_empty_batch_gives_empty_result(self):
+        m = CoherenceMetric().calculate_many(SystemBatch.from_states([]))
+        self.assertEqual(m.shape, (0,))
+
+    def test_batch_without_zero_factors_matches(self):
+        metric = CoherenceMetric()
+        states = [
+            SystemState(0.9, 0.85, 0.8, np.array([[1 / PHI, 0.3], [0.3, 1 / PHI]]), 0.1),
+            SystemState(0.3, 0.4, 0.2, np.array([[2.0, 0.1], [0.1, 2.0]]), 0.8),
+        ]
+        batch_m = metric.calculate_many(SystemBatch.from_states(states))
+        for state, m in zip(states, batch_m):
+            self.assertAlmostEqual(m, metric.calculate_from_state(state), places=12)
+
+    def test_missing_energy_cost_is_nan(self):
+        batch = SystemBatch.from_states([
+            SystemState(0.9, 0.9, 0.9, np.eye(2) / PHI, 0.1, energy_cost=6),
+            SystemState(0.9, 0.9, 0.9, np.eye(2) / PHI, 0.1),
+        ])
+        self.assertEqual(batch.energy_cost[0], 6.0)
+        self.assertTrue(math.isnan(batch.energy_cost[1]))
+
 
 class EfficiencyTests(unittest.TestCase):
     def test_efficiency_ratio_returns_none_without_cost(self):
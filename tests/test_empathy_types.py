@@ -1,12 +1,20 @@
 """Falsifiable tests for src.measurement.empathy_types."""
 
+import dataclasses
+import json
 import unittest
 
+from src.core.coherence_metric import CoherenceMetric
 from src.measurement.empathy_types import (
+    EMPATHY_CONSTANTS,
+    _AI_SWARM_COUPLING,
+    _RELATIONAL_COUPLING,
+    _TRIBAL_COUPLING,
     AISwarmReciprocity,
     RelationalEmpathy,
     TribalEmpathy,
     compare_empathy_types,
+    measure_by_name,
 )
 
 
@@ -32,5 +40,136 @@ class EmpathyOrderingTests(unittest.TestCase):
         self.assertEqual(names, ["AI Swarm", "Relational", "Tribal"])
 
 
+class MeasurementCacheTests(unittest.TestCase):
+    def test_repeated_measure_returns_same_reading(self):
+        pattern = RelationalEmpathy()
+        self.assertIs(pattern.measure(), pattern.measure())
+
+    def test_comparison_matches_individual_measurements(self):
+        result = compare_empathy_types()
+        for key, pattern in (
+            ("tribal", TribalEmpathy()),
+            ("relational", RelationalEmpathy()),
+            ("ai_swarm", AISwarmReciprocity()),
+        ):
+            m, breakdown = pattern.measure()
+            self.assertEqual(result[key]["M_S"], m)
+            self.assertEqual(result[key]["breakdown"], breakdown)
+
+    def test_interpretation_is_rendered_lazily(self):
+        result = compare_empathy_types()
+        reading = result["tribal"]
+        self.assertNotIn("interpretation", vars(reading))
+        self.assertIn("Tribal Empathy", reading["interpretation"])
+        self.assertIn("MEASUREMENT, not prescription", result["summary"])
+
+    def test_results_read_like_the_dicts_they_replace(self):
+        result = compare_empathy_types()
+        self.assertEqual(
+            set(result), {"tribal", "relational", "ai_swarm", "ranking", "summary"}
+        )
+        reading = result["tribal"]
+        self.assertEqual(set(reading.keys()), {"M_S", "breakdown", "interpretation"})
+        self.assertIn("M_S", reading)
+        self.assertNotIn("pattern", reading)
+        self.assertIsNone(reading.get("missing"))
+        with self.assertRaises(KeyError):
+            result["missing"]
+        self.assertEqual(reading, dict(reading))
+
+    def test_comparison_serializes_to_json(self):
+        data = json.loads(json.dumps(compare_empathy_types().to_dict()))
+        self.assertEqual(data["tribal"]["breakdown"]["loss_rate"], 0.9)
+        self.assertEqual(data["ranking"][0], ["AI Swarm", data["ai_swarm"]["M_S"]])
+
+
+class BreakdownTests(unittest.TestCase):
+    def test_memoized_breakdown_cannot_be_changed(self):
+        pattern = TribalEmpathy()
+        _, breakdown = pattern.measure()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            breakdown.loss_rate = 0.0
+        self.assertEqual(pattern.measure()[1].loss_rate, 0.9)
+
+    def test_breakdown_reads_like_a_dict(self):
+        _, breakdown = TribalEmpathy().measure()
+        self.assertEqual(breakdown["resonance"], breakdown.resonance)
+        self.assertIn("f_C", breakdown)
+        self.assertIsNone(breakdown.get("computational_overhead"))
+        with self.assertRaises(KeyError):
+            breakdown["computational_overhead"]
+        self.assertEqual(breakdown, dict(breakdown))
+
+    def test_violence_cost_is_reported_as_loss_rate(self):
+        _, breakdown = TribalEmpathy().measure()
+        self.assertEqual(
+            list(breakdown),
+            ["resonance", "adaptability", "diversity", "loss_rate", "f_C"],
+        )
+        self.assertNotIn("violence_cost", breakdown)
+
+    def test_breakdown_serializes_to_json(self):
+        _, breakdown = RelationalEmpathy().measure()
+        self.assertEqual(json.loads(json.dumps(breakdown.to_dict())), dict(breakdown))
+
+
+class MetricTests(unittest.TestCase):
+    def test_supplied_metric_is_used(self):
+        metric = CoherenceMetric(alpha=3.0)
+        pattern = TribalEmpathy(metric)
+        self.assertIs(pattern.metric, metric)
+        self.assertNotEqual(pattern.measure()[0], TribalEmpathy().measure()[0])
+
+    def test_patterns_do_not_share_a_default_metric(self):
+        self.assertIsNot(TribalEmpathy().metric, RelationalEmpathy().metric)
+
+    def test_breakdown_f_c_follows_the_metric(self):
+        for alpha in (1.0, 3.0):
+            for pattern, coupling in (
+                (TribalEmpathy(CoherenceMetric(alpha)), _TRIBAL_COUPLING),
+                (RelationalEmpathy(CoherenceMetric(alpha)), _RELATIONAL_COUPLING),
+                (AISwarmReciprocity(CoherenceMetric(alpha)), _AI_SWARM_COUPLING),
+            ):
+                _, breakdown = pattern.measure()
+                self.assertEqual(
+                    breakdown['f_C'], pattern.metric.coupling_function(coupling)
+                )
+
+
+class MeasureByNameTests(unittest.TestCase):
+    def test_matches_pattern_measurement(self):
+        for name, pattern in (
+            ("tribal", TribalEmpathy()),
+            ("relational", RelationalEmpathy()),
+            ("ai_swarm", AISwarmReciprocity()),
+        ):
+            self.assertEqual(measure_by_name(name), pattern.measure())
+
+    def test_unknown_name_raises(self):
+        with self.assertRaises(KeyError):
+            measure_by_name("unknown")
+
+    def test_comparison_reuses_memoized_readings(self):
+        result = compare_empathy_types()
+        for name in EMPATHY_CONSTANTS:
+            self.assertIs(result[name]["breakdown"], measure_by_name(name)[1])
+
+    def test_recipe_table_is_read_only(self):
+        with self.assertRaises(TypeError):
+            EMPATHY_CONSTANTS["tribal"] = (1.0, 1.0, 1.0, 0.0, None)
+
+    def test_state_follows_recipe_table(self):
+        for pattern in (TribalEmpathy(), RelationalEmpathy(), AISwarmReciprocity()):
+            resonance, adaptability, diversity, loss_rate, coupling = (
+                EMPATHY_CONSTANTS[pattern._KEY]
+            )
+            state = pattern._state()
+            self.assertEqual(
+                (state.resonance_energy, state.adaptability, state.diversity, state.loss_rate),
+                (resonance, adaptability, diversity, loss_rate),
+            )
+            self.assertIs(state.coupling_matrix, coupling)
+
+
 if __name__ == "__main__":
     unittest.main()
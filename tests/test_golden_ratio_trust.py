@@ -1,5 +1,6 @@
 """Falsifiable tests for src.core.golden_ratio_trust."""
 
+import dataclasses
 import unittest
 
 from src.core.golden_ratio_trust import PHI, GoldenRatioTrust, TrustState
@@ -32,6 +33,43 @@ class ExpansionTests(unittest.TestCase):
         # new chamber trust = foundation * (PHI - 1), foundation = 0.5
         self.assertAlmostEqual(new_chamber.chamber_trust, 0.5 * (PHI - 1), places=9)
 
+    def test_foundation_is_sum_of_all_prior_chambers(self):
+        grt = GoldenRatioTrust(initial_trust=0.5, trust_threshold=0.3)
+        for _ in range(4):
+            grt.attempt_expand(positive_interactions=5, interaction_quality=0.9)
+        grt.record_violation(severity=0.9)  # collapse the newest chamber
+        grt.attempt_expand(positive_interactions=5, interaction_quality=0.9)
+        chambers = list(grt.chambers)
+        self.assertAlmostEqual(
+            chambers[-1].foundation_trust,
+            sum(c.chamber_trust for c in chambers[:-1]),
+            places=12,
+        )
+
+
+class ChamberStoreTests(unittest.TestCase):
+    def test_store_grows_past_initial_capacity(self):
+        grt = GoldenRatioTrust(initial_trust=0.5, trust_threshold=0.3)
+        for _ in range(70):
+            grt.attempt_expand(positive_interactions=5, interaction_quality=0.9)
+        self.assertEqual(len(grt.chambers), 71)
+        self.assertEqual(grt.chambers[-1].chamber_id, 70)
+        self.assertEqual(grt.chambers[0].chamber_trust, 0.5)
+
+    def test_store_slices_like_a_list(self):
+        grt = GoldenRatioTrust(initial_trust=0.5, trust_threshold=0.3)
+        for _ in range(3):
+            grt.attempt_expand(positive_interactions=5, interaction_quality=0.9)
+        chambers = list(grt.chambers)
+        self.assertEqual(grt.chambers[:1], chambers[:1])
+        self.assertEqual(grt.chambers[1:], chambers[1:])
+        self.assertEqual(grt.chambers[::-2], chambers[::-2])
+
+    def test_chamber_snapshots_are_read_only(self):
+        grt = GoldenRatioTrust()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            grt.chambers[-1].can_expand = False
+
 
 class ViolationTests(unittest.TestCase):
     def test_severe_violation_collapses_most_recent_chamber(self):
@@ -59,5 +97,17 @@ class ViolationTests(unittest.TestCase):
         self.assertTrue(ok)
 
 
+class VisualizationTests(unittest.TestCase):
+    def test_non_positive_trust_draws_empty_bar(self):
+        for trust in (-0.1, 0.0):
+            spiral = GoldenRatioTrust(initial_trust=trust).visualize_spiral()
+            self.assertIn(f"Chamber 0 ○:  ({trust:.3f})", spiral)
+            self.assertNotIn("█", spiral)
+
+    def test_bar_length_tracks_chamber_trust(self):
+        spiral = GoldenRatioTrust(initial_trust=0.1).visualize_spiral()
+        self.assertIn("Chamber 0 ○: " + "█" * 5 + " (0.100)", spiral)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,11 @@
 """Falsifiable tests for src.measurement.replacement_analysis."""
 
+import json
 import unittest
 
 import numpy as np
 
-from src.core.coherence_metric import PHI, SystemState
+from src.core.coherence_metric import PHI, CoherenceMetric, SystemBatch, SystemState
 from src.measurement.replacement_analysis import (
     ReplacementAnalysis,
     ReplacementScenario,
@@ -93,6 +94,98 @@ class EthicalFlagTests(unittest.TestCase):
         flags = {f["flag"] for f in result["ethical_flags"]}
         self.assertIn("NO_CONSENT", flags)
 
+    def test_energy_flag_reports_the_increase(self):
+        scenario = ReplacementScenario(
+            current=_robot(),
+            replacement=_worker(),
+            context="robot to human",
+            ethical_considerations="with consent",
+        )
+        scenario.replacement.energy_cost = scenario.current.energy_cost + 75
+        result = ReplacementAnalysis().analyze(scenario)
+        flags = {f["flag"]: f for f in result["ethical_flags"]}
+        energy = flags["ENERGY_EXPLOSION"]
+        self.assertEqual(energy["description"], "Energy cost increases by 75.0 kWh/day")
+        self.assertEqual(energy["note"], "Unsustainable energy scaling")
+
+    def test_flags_are_plain_dicts(self):
+        scenario = ReplacementScenario(
+            current=_worker(),
+            replacement=_robot(),
+            context="human to robot",
+        )
+        flags = ReplacementAnalysis().analyze(scenario)["ethical_flags"]
+        self.assertTrue(flags)
+        for flag in flags:
+            self.assertIsInstance(flag, dict)
+            self.assertEqual(list(flag), ["severity", "flag", "description", "note"])
+        self.assertIn('"severity": "CRITICAL"', json.dumps(flags))
+
+
+class ThermodynamicVerdictTests(unittest.TestCase):
+    def test_verdict_by_delta_signs(self):
+        assess = ReplacementAnalysis()._thermodynamic_assessment
+        self.assertTrue(assess(0.2, -5.0, None).startswith("THERMODYNAMICALLY_SUPERIOR"))
+        self.assertTrue(assess(0.2, 5.0, 0.01).startswith("THERMODYNAMICALLY_FAVORABLE"))
+        self.assertIn("higher coherence but also higher energy", assess(0.2, 5.0, -0.01))
+        self.assertIn("lower energy but also lower coherence", assess(-0.2, -5.0, None))
+        self.assertTrue(assess(-0.2, 5.0, None).startswith("THERMODYNAMICALLY_STUPID"))
+
+    def test_unchanged_energy_is_not_an_improvement(self):
+        assess = ReplacementAnalysis()._thermodynamic_assessment
+        self.assertTrue(assess(0.2, 0.0, 0.01).startswith("THERMODYNAMICALLY_STUPID"))
+        self.assertTrue(assess(0.0, -5.0, None).startswith("THERMODYNAMICALLY_STUPID"))
+
+
+class MetricOwnershipTests(unittest.TestCase):
+    def test_analyzers_do_not_share_a_default_metric(self):
+        first, second = ReplacementAnalysis(), ReplacementAnalysis()
+        first.metric.alpha = 2.0
+        self.assertEqual(second.metric.alpha, 1.0)
+
+    def test_supplied_metric_is_used(self):
+        metric = CoherenceMetric(alpha=3.0)
+        self.assertIs(ReplacementAnalysis(metric).metric, metric)
+
+
+class BatchAnalysisTests(unittest.TestCase):
+    def test_batch_matches_single_analysis(self):
+        worker, robot = _worker(), _robot()
+        robot_no_cost = _robot()
+        robot_no_cost.energy_cost = None
+        current = [worker, robot, worker]
+        replacement = [robot, worker, robot_no_cost]
+
+        analyzer = ReplacementAnalysis()
+        batch = analyzer.analyze_batch(
+            SystemBatch.from_states(current),
+            SystemBatch.from_states(replacement),
+        )
+        for i, (cur, rep) in enumerate(zip(current, replacement)):
+            single = analyzer.analyze(ReplacementScenario(cur, rep, context="pair"))
+            for section in ("coherence", "energy", "efficiency"):
+                for key, value in single[section].items():
+                    batch_value = batch[section][key][i]
+                    if value is None:
+                        self.assertTrue(np.isnan(batch_value))
+                    else:
+                        self.assertAlmostEqual(batch_value, value, places=12)
+            self.assertEqual(
+                batch["thermodynamic_verdict"][i], single["thermodynamic_verdict"]
+            )
+            single_flags = {f["flag"] for f in single["ethical_flags"]}
+            for name, raised in batch["ethical_flags"].items():
+                self.assertEqual(bool(raised[i]), name in single_flags)
+            self.assertIn("NO_CONSENT", batch["unevaluated_flags"][i])
+            self.assertIn("HUMAN_REPLACEMENT", batch["unevaluated_flags"][i])
+
+    def test_empty_batch_gives_empty_result(self):
+        empty = SystemBatch.from_states([])
+        batch = ReplacementAnalysis().analyze_batch(empty, empty)
+        self.assertEqual(batch["coherence"]["delta"].shape, (0,))
+        self.assertEqual(batch["thermodynamic_verdict"].shape, (0,))
+        self.assertEqual(batch["unevaluated_flags"].shape, (0,))
+
 
 if __name__ == "__main__":
     unittest.main()